@@ -2,6 +2,8 @@ import numpy as np
 import pandas as pd
 import networkx as nx
 
+from mst_core import kruskal
+
 # Calculates the log of the given dataframe
 def calc_log(data):
     return np.log(data)
@@ -11,62 +13,59 @@ def calc_diff(data):
     return data.apply(np.diff)
 
 # Calculates the correlation of the returns
-def calc_corr(data):
-    return data.corr()
+# Columns with no data at all, such as a failed download, come back as NaN
+# like they do from data.corr(). When there are no other gaps the
+# standardized returns are multiplied in a single matrix product rather than
+# pair by pair; otherwise pandas handles the gaps pair by pair, since dropping
+# rows would shrink every pair to the shortest history
+# Passing dtype=np.float32 halves the memory traffic of the product, at the
+# cost of correlations accurate to about 1e-7
+def calc_corr(data, dtype=np.float64):
+    valid = data.loc[:, data.notna().any()]
+    x = valid.to_numpy(dtype=float)
+    if np.isnan(x).any():
+        return data.corr()
+    if x.shape[0] < 2:
+        return pd.DataFrame(np.nan, index=data.columns, columns=data.columns)
+    z = ((x - x.mean(axis=0)) / x.std(axis=0, ddof=1)).astype(dtype, copy=False)
+    corr = np.dot(z.T, z).astype(float, copy=False) / (z.shape[0] - 1)
+    np.fill_diagonal(corr, 1.0)
+    corr = pd.DataFrame(corr, index=valid.columns, columns=valid.columns)
+    return corr.reindex(index=data.columns, columns=data.columns)
 
 # Calculates the distance based on the equation from the paper
+# Negative values from floating point noise are clipped to zero before the root
+# Every step after the first writes into the same buffer, so no temporaries
 def calc_dist(data):
-    return np.sqrt(2 * (1 - data))
+    dist = np.subtract(1, data.to_numpy(dtype=float))
+    np.multiply(dist, 2, out=dist)
+    np.maximum(dist, 0, out=dist)
+    np.sqrt(dist, out=dist)
+    return pd.DataFrame(dist, index=data.index, columns=data.columns)
 
 # Given a dataframe, returns a graph that connects all the non-zero edges
 def all_connected(data):
     g = nx.Graph()
-    for i in data.columns:
-        for j in data.index:
-            edge_length = data.loc[i, j]
-            if edge_length != 0:
-                g.add_edge(i, j, length = edge_length)
+    values = data.to_numpy()
+    # Locate every non-zero cell in one pass instead of a .loc lookup per cell
+    rows, cols = np.nonzero(values)
+    g.add_edges_from((data.index[i], data.columns[j], {'length': values[i, j]})
+                     for i, j in zip(rows, cols))
     return g
 
 # Returns the MST of a given dataframe using Kruskal's Algorithm
 def minimum_spanning_tree(data):
-
-    # Initilize edge and vertex counts
-    number_edge = 0
     number_vertex = len(data)
 
-    # Initilize a copy of the distance matrix with all 0's
-    new_data = data.copy()
-    new_data[:] = 0
-
-    # Check who the parent is in order to search for cycles
-    def find(i):
-        while parent[i] != i:
-            i = parent[i]
-        return i
-
-    # Initialize a list of parents and vertex to track cycles
-    parent = list(np.linspace(0,number_vertex - 1,number_vertex).astype(int))
-    vertex = list(np.linspace(0,number_vertex - 1,number_vertex).astype(int))
-
-    # Terminate program when number of edges = number of vertex - 1
-    while number_edge < number_vertex - 1:
-        # Placeholder variables for calculation
-        d_min = 100
-        a, b = -1, -1
-
-        # Iterates through the upper triangle of the matrix
-        for i in range(len(vertex)):
-            for j in range(i + 1, len(vertex)):
-                if find(i) != find(j) and data.iloc[i, j] < d_min:
-                    d_min = data.iloc[i, j]
-                    a, b = i, j
-
-        # Link the two points together
-        parent[find(a)] = find(b)
+    # Sort the edges of the upper triangle of the matrix once, shortest first
+    values = data.to_numpy()
+    upper_i, upper_j = np.triu_indices(number_vertex, k=1)
+    order = np.argsort(values[upper_i, upper_j], kind='stable')
 
-        # Set the distance for the new distance matrix
-        new_data.iloc[a, b] = data.iloc[a, b]
-        number_edge += 1
+    # Pick the tree edges, compiled with numba when it is installed
+    tree_i, tree_j = kruskal(order, upper_i, upper_j, number_vertex)
 
-    return new_data
+    # Set the distances for a new distance matrix that is 0 elsewhere
+    new_values = np.zeros_like(values)
+    new_values[tree_i, tree_j] = values[tree_i, tree_j]
+    return pd.DataFrame(new_values, index=data.index, columns=data.columns)
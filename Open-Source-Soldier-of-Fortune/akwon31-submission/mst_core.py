@@ -0,0 +1,50 @@
+import numpy as np
+
+# Numba is optional, without it the loop below runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Find the root of vertex i, halving the path on the way up
+@njit(cache=True)
+def find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+# Kruskal's Algorithm on edges already sorted by length
+# order holds the sorted edge positions, and (upper_i[k], upper_j[k]) are the
+# two vertices of edge k. Returns the vertex pairs of the tree edges
+@njit(cache=True)
+def kruskal(order, upper_i, upper_j, number_vertex):
+    parent = np.arange(number_vertex)
+    rank = np.zeros(number_vertex, dtype=np.int64)
+    tree_i = np.empty(max(number_vertex - 1, 0), dtype=np.int64)
+    tree_j = np.empty(max(number_vertex - 1, 0), dtype=np.int64)
+    number_edge = 0
+
+    for k in order:
+        # Terminate when number of edges = number of vertex - 1
+        if number_edge == number_vertex - 1:
+            break
+
+        a, b = upper_i[k], upper_j[k]
+        root_a, root_b = find(parent, a), find(parent, b)
+        if root_a == root_b:
+            continue
+
+        # Link the two points together, hanging the shorter tree off the taller
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+
+        tree_i[number_edge] = a
+        tree_j[number_edge] = b
+        number_edge += 1
+
+    return tree_i[:number_edge], tree_j[:number_edge]
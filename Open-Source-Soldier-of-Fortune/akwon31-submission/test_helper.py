@@ -0,0 +1,56 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from helper import all_connected, calc_corr, calc_dist, minimum_spanning_tree
+
+
+@pytest.fixture
+def returns():
+    '''
+    Made-up daily returns for five tickers
+    '''
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(250, 5)), columns=list('ABCDE'))
+
+
+def test_corr_matches_pandas(returns):
+    '''
+    Without gaps the matrix product agrees with data.corr().
+    '''
+    pd.testing.assert_frame_equal(calc_corr(returns), returns.corr())
+
+
+def test_corr_failed_ticker(returns):
+    '''
+    A column with no data is NaN, and leaves the other pairs alone.
+    '''
+    returns['E'] = np.nan
+    corr = calc_corr(returns)
+
+    assert corr['E'].isna().all() and corr.loc['E'].isna().all()
+    pd.testing.assert_frame_equal(corr.iloc[:4, :4], returns.iloc[:, :4].corr())
+
+
+def test_corr_short_history(returns):
+    '''
+    A short history only shortens the pairs it is part of.
+    '''
+    returns.loc[:244, 'E'] = np.nan
+    corr = calc_corr(returns)
+
+    pd.testing.assert_frame_equal(corr, returns.corr())
+    pd.testing.assert_frame_equal(corr.iloc[:4, :4], returns.iloc[:, :4].corr())
+
+
+def test_minimum_spanning_tree(returns):
+    '''
+    The tree from the Kruskal core is the one networkx finds.
+    '''
+    dist = calc_dist(calc_corr(returns))
+    tree = minimum_spanning_tree(dist)
+    expected = nx.minimum_spanning_tree(all_connected(dist), weight='length')
+
+    assert ({frozenset(edge) for edge in all_connected(tree).edges()}
+            == {frozenset(edge) for edge in expected.edges()})
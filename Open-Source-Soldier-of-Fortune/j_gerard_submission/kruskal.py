@@ -22,33 +22,68 @@ Josiah Carlson: http://aspn.activestate.com/ASPN/Cookbook/Python/Recipe/215912
 D. Eppstein: http://www.ics.uci.edu/~eppstein/PADS/UnionFind.py
 '''
 
+import hashlib
+import os
+from datetime import date
+from functools import cached_property
+
 import yfinance as yf
 import pandas as pd
 import networkx as nx
 import numpy as np
-import matplotlib.pyplot as plt
+from networkx.utils import UnionFind
 
 
-def daily_log_returns(ticker_list):
+def daily_log_returns(ticker_list, cache_dir='.cache'):
     '''
     Computes daily close to close log returns for a list of tickers
 
+    Note
+    ====
+    Returns are cached as a pickle file in cache_dir, keyed by the
+    ticker list and the current date, so re-runs on the same day skip
+    the download. Pass cache_dir=None to always download.
+
     Parameters
     ==========
     ticker_list: list
+    cache_dir: str or None
 
     Returns
     =======
     pd.Dataframe
     '''
+    if cache_dir is not None:
+        key = hashlib.sha1(repr(
+            (list(ticker_list), date.today().isoformat())).encode()).hexdigest()
+        cache_path = os.path.join(cache_dir, key + '.pkl')
+        if os.path.exists(cache_path):
+            return pd.read_pickle(cache_path)
+
+    # fetch every ticker in one threaded request rather than one at a time
+    prices_df = yf.download(tickers=list(ticker_list), period='max',
+                            auto_adjust=True, threads=True, progress=False,
+                            group_by='ticker')
+
+    # older yfinance releases return flat Open/High/Low/Close columns
+    # instead of per-ticker columns when only one ticker is requested
+    per_ticker = isinstance(prices_df.columns, pd.MultiIndex)
+
     log_returns_list = []
     for ticker in ticker_list:
-        ticker_df = yf.Ticker(ticker).history(period='max')
-        ticker_df['log_return_' + ticker] = np.log(
-            ticker_df['Close']) - np.log(ticker_df['Close'].shift(1))
-        log_returns_list.append(ticker_df['log_return_' + ticker])
+        # drop the dates on which this ticker did not trade, as a
+        # per-ticker history would
+        close = (prices_df[ticker] if per_ticker else prices_df)['Close'].dropna()
+        log_returns_list.append(
+            (np.log(close) - np.log(close.shift(1))).rename('log_return_' + ticker))
 
-    return pd.concat(log_returns_list, axis=1)
+    log_returns = pd.concat(log_returns_list, axis=1)
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        log_returns.to_pickle(cache_path)
+
+    return log_returns
 
 
 def compute_distance(returns_df, correlation_method='pearson'):
@@ -91,8 +126,6 @@ class KruskalMST():
 
     '''
 
-    import networkx as nx
-
     def __init__(self, distance_df):
 
         self.distance_df = distance_df
@@ -113,12 +146,40 @@ class KruskalMST():
         '''
 
         G = nx.Graph()
-        for i in distance_df.index:
-            for j in distance_df.columns:
-                G.add_edge(i, j, distance=distance_df.loc[i, j])
+        G.add_nodes_from(distance_df.index)
+
+        # the distance matrix is symmetric, so only the upper triangle is
+        # needed; k=1 also leaves out the zero-distance self loops
+        values = distance_df.to_numpy()
+        rows, cols = np.triu_indices(len(values), k=1)
+        G.add_edges_from(
+            (distance_df.index[i], distance_df.columns[j],
+             {'distance': values[i, j]})
+            for i, j in zip(rows, cols))
 
         return G
 
+    @cached_property
+    def _sorted_edges(self):
+        '''
+        Edges of the Graph in increasing order of distance. Sorted once
+        and reused by every call to _min_span_edges
+
+        Note
+        ====
+        NaN distances, e.g. from a ticker whose download failed, are
+        sorted last, as comparisons with NaN would otherwise leave the
+        finite distances out of order too.
+
+        Returns
+        =======
+        list
+        '''
+
+        return sorted(self.graph.edges(data=True),
+                      key=lambda edge: (np.isnan(edge[2]['distance']),
+                                        edge[2]['distance']))
+
     def _min_span_edges(self, data=True):
         '''
         Computes minumum spanning edges between nodes in Graph
@@ -136,7 +197,6 @@ class KruskalMST():
 
         '''
 
-        from networkx.utils import UnionFind
         ##############################################################
         # networkx implementation for finding minimum spanning edges #
         ##############################################################
@@ -146,14 +206,18 @@ class KruskalMST():
                 "Mimimum spanning tree not defined for directed graphs.")
 
         subtrees = UnionFind()
-        edges = sorted(self.graph.edges(data=True))
-        for u, v, d in edges:
+        # a spanning tree over n nodes is complete after n - 1 edges
+        edges_left = self.graph.number_of_nodes() - 1
+        for u, v, d in self._sorted_edges:
+            if edges_left <= 0:
+                break
             if subtrees[u] != subtrees[v]:
                 if data:
                     yield (u, v, d)
                 else:
                     yield (u, v)
                 subtrees.union(u, v)
+                edges_left -= 1
 
     def min_span_tree(self):
         '''
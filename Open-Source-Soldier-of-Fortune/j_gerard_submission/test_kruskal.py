@@ -0,0 +1,99 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+# kruskal imports yfinance at module level
+pytest.importorskip("yfinance")
+import kruskal
+
+
+def fake_download(flat_columns):
+    '''
+    Builds a stand-in for yf.download returning made-up closes, with flat
+    columns for a single ticker when flat_columns is True, as older
+    yfinance releases do. Any ticker after the first starts trading on the
+    third day, so its first two closes are NaN.
+    '''
+    def download(tickers, **kwargs):
+        index = pd.date_range('2020-01-01', periods=4, freq='B')
+        closes = np.array([100., 101., 99., 102.])
+        if flat_columns and len(tickers) == 1:
+            return pd.DataFrame({'Open': closes, 'Close': closes}, index=index)
+        columns = pd.MultiIndex.from_product([tickers, ['Open', 'Close']])
+        prices_df = pd.DataFrame(np.repeat(closes[:, None], len(columns), axis=1),
+                                 index=index, columns=columns)
+        prices_df.iloc[:2, 2:] = np.nan
+        return prices_df
+    return download
+
+
+@pytest.mark.parametrize("flat_columns", [True, False],
+                         ids=["flat", "per_ticker"])
+def test_single_ticker(monkeypatch, flat_columns):
+    '''
+    One ticker gives one column of log returns whatever the column layout.
+    '''
+    monkeypatch.setattr(kruskal.yf, 'download', fake_download(flat_columns))
+    log_returns = kruskal.daily_log_returns(['SPY'], cache_dir=None)
+
+    assert list(log_returns.columns) == ['log_return_SPY']
+    np.testing.assert_allclose(log_returns['log_return_SPY'].iloc[1:],
+                               np.diff(np.log([100., 101., 99., 102.])))
+
+
+def test_several_tickers(monkeypatch):
+    '''
+    Several tickers keep the order of the ticker list, and each ticker's
+    returns run over its own trading dates, so a shorter history does not
+    cut the longer one.
+    '''
+    monkeypatch.setattr(kruskal.yf, 'download', fake_download(True))
+    log_returns = kruskal.daily_log_returns(['SPY', 'AAPL'], cache_dir=None)
+
+    assert list(log_returns.columns) == ['log_return_SPY', 'log_return_AAPL']
+    np.testing.assert_allclose(log_returns['log_return_SPY'].iloc[1:],
+                               np.diff(np.log([100., 101., 99., 102.])))
+    assert log_returns['log_return_AAPL'].iloc[:3].isna().all()
+    assert log_returns['log_return_AAPL'].iloc[3] == pytest.approx(np.log(102. / 99.))
+
+
+@pytest.fixture
+def returns():
+    '''
+    Made-up daily log returns for eight tickers
+    '''
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(250, 8)),
+                        columns=['log_return_' + c for c in 'ABCDEFGH'])
+
+
+def tree_edges(graph):
+    return {frozenset(edge) for edge in graph.edges()}
+
+
+def test_min_span_tree(returns):
+    '''
+    The tree is the one networkx finds.
+    '''
+    mst = kruskal.KruskalMST(kruskal.compute_distance(returns))
+    expected = nx.minimum_spanning_tree(mst.graph, weight='distance')
+
+    assert tree_edges(mst.min_span_tree()) == tree_edges(expected)
+
+
+def test_min_span_tree_nan_column(returns):
+    '''
+    A ticker with no data does not reorder the finite distances, and is
+    attached to the tree last.
+    '''
+    returns['log_return_A'] = np.nan
+    mst = kruskal.KruskalMST(kruskal.compute_distance(returns))
+    tree = mst.min_span_tree()
+    expected = nx.minimum_spanning_tree(mst.graph, weight='distance',
+                                        ignore_nan=True)
+
+    finite = nx.Graph((u, v) for u, v, d in tree.edges(data='distance')
+                      if not np.isnan(d))
+    assert tree_edges(finite) == tree_edges(expected)
+    assert tree.number_of_edges() == len(returns.columns) - 1
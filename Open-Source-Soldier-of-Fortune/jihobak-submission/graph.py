@@ -32,15 +32,15 @@ def build_graph(vertices, edges):
     # adding nodes to the graph.
     graph.add_nodes_from(vertices)
 
-    # link every pairs from edges
-    for edge in edges:
-        weight, vertex_1, vertex_2 = edge
-        graph.add_edge(vertex_1, vertex_2, weight=round(weight, 4))
+    # link every pairs from edges, keeping the full precision weights.
+    # weights are rounded only for the labels in draw_graph
+    graph.add_weighted_edges_from(
+        (vertex_1, vertex_2, weight) for weight, vertex_1, vertex_2 in edges)
 
     return graph
 
 
-def draw_graph(graph, color_index, cmap, label=True):
+def draw_graph(graph, color_index, cmap, label=True, show=True, pos=None):
     """
     Draw network graph from graph instance of networkx
 
@@ -56,15 +56,33 @@ def draw_graph(graph, color_index, cmap, label=True):
         color map for plotting graph
 
     label: bool
-        If label is True, it shows weights of edges, default is True
+        If label is True, it shows weights of edges rounded to 4 decimals, default is True
+
+    show: bool
+        If show is True, it calls plt.show() which blocks until the window is closed,
+        default is True. Use False in scripts and tests.
+
+    pos: dict
+        positions of vertices keyed by vertex name. If pos is None, it is computed
+        with nx.spring_layout. Pass the returned positions to draw the same graph again
+        without recomputing the layout, default is None
+
+    Returns
+    -------
+    pos : dict
+        positions of vertices used for drawing
     """
-    pos = nx.spring_layout(graph)
-    nx.draw_networkx_edges(graph, pos)
+    if pos is None:
+        pos = nx.spring_layout(graph)
     nx.draw_networkx_edges(graph, pos, width=1)
     nx.draw_networkx_labels(graph, pos, font_size=10, font_family='sans-serif')
-    labels = nx.get_edge_attributes(graph, 'weight')
     if label:
+        labels = {edge: round(weight, 4)
+                  for edge, weight in nx.get_edge_attributes(graph, 'weight').items()}
         nx.draw_networkx_edge_labels(graph, pos, edge_labels=labels)
 
     nx.draw(graph, pos, node_color=color_index, cmap=cmap, node_size=700, alpha=0.5)
-    plt.show()
+    if show:
+        plt.show()
+
+    return pos
@@ -87,10 +87,16 @@ class MinimumSpanningTree:
             parent of vertex: (string) : name of parent of vertex
 
         """
-        if self.parent[vertex] != vertex:
-            self.parent[vertex] = self.find_parent(self.parent[vertex])
+        # walk up to the root
+        root = vertex
+        while self.parent[root] != root:
+            root = self.parent[root]
 
-        return self.parent[vertex]
+        # compress the path so every vertex on it points directly at the root
+        while self.parent[vertex] != root:
+            self.parent[vertex], vertex = root, self.parent[vertex]
+
+        return root
 
     def check_connected(self, vertex_1, vertex_2):
         """
@@ -152,23 +158,11 @@ class MinimumSpanningTree:
                 if len(self.__graph_edges) == len(self.vertices)-1:
                     break
 
-        # build graph map from edges
-        graph_edges = self.__graph_edges.copy()
-
-        for vertex in self.vertices:
-            # get edges that contain 'vertex'
-
-            rm_ix = []
-            if graph_edges:
-                for i, (distance, vertex_1, vertex_2) in enumerate(graph_edges):
-                    # if the edge contains 'vertex', Let's add it to graph_map
-                    # and save the index of edge to remove it from graph_edges
-                    if vertex in (vertex_1, vertex_2):
-                        rm_ix.append(i)
-                        if vertex == vertex_1:
-                            self.__graph_map[vertex][vertex_2] = distance
-                        else:
-                            self.__graph_map[vertex][vertex_1] = distance
+        # build graph map from edges, linking both vertices of each edge directly
+        # instead of scanning every edge for every vertex
+        for distance, vertex_1, vertex_2 in self.__graph_edges:
+            self.__graph_map[vertex_1][vertex_2] = distance
+            self.__graph_map[vertex_2][vertex_1] = distance
 
         print(f"The building of tree is completed")
         return self.__graph_edges
@@ -51,21 +51,45 @@ class TestMST(unittest.TestCase):
             ('E', 'D'): (['E', 'A', 'B', 'C', 'D'], 11)
         }
 
+        # correct edges of tree as (distance, {vertex_1, vertex_2}), regardless of direction and order
+        cls.tree_edges = {
+            (1, frozenset({'A', 'E'})),
+            (2, frozenset({'C', 'D'})),
+            (3, frozenset({'A', 'B'})),
+            (5, frozenset({'B', 'C'}))
+        }
+
         # This tree will be used for final test whether tree make a correct tree as a result.
         cls.mst = MinimumSpanningTree(cls.vertices, cls.edges)
         cls.mst.build()
 
+        # Small graphs shared by the union-find tests, as (vertices, edges).
+        cls.connected_graph = (
+            ['A', 'B', 'E'],
+            [
+                [1, 'A', 'E'],
+                [3, 'A', 'B'],
+            ]
+        )
+        cls.disconnected_graph = (
+            ['A', 'E', 'C', 'D'],
+            [
+                [1, 'A', 'E'],
+                [2, 'C', 'D'],
+            ]
+        )
+
+        # Trees built once from the small graphs, the tests only inspect them.
+        cls.connected_mst = MinimumSpanningTree(*cls.connected_graph)
+        cls.connected_mst.build()
+        cls.disconnected_mst = MinimumSpanningTree(*cls.disconnected_graph)
+        cls.disconnected_mst.build()
+
     def test_find_parent_when_connected(self):
         """
         Test whether tree find root parent of vertex correctly when vertices are connected.
         """
-        vertices = ['A', 'B', 'E']
-        edges = [
-            [1, 'A', 'E'],
-            [3, 'A', 'B'],
-        ]
-        mst = MinimumSpanningTree(vertices, edges)
-        mst.build()
+        mst = self.connected_mst
         parent = list(mst.parent.values())
 
         # root parent should be 'A'
@@ -75,13 +99,7 @@ class TestMST(unittest.TestCase):
         """
         Test whether tree find root parent of vertex correctly when vertices are not fully connected.
         """
-        vertices = ['A', 'E', 'C', 'D']
-        edges = [
-            [1, 'A', 'E'],
-            [2, 'C', 'D'],
-        ]
-        mst = MinimumSpanningTree(vertices, edges)
-        mst.build()
+        mst = self.disconnected_mst
         parent = list(mst.parent.values())
         answer = ['A', 'A', 'C', 'C']
         self.assertListEqual(parent, answer)
@@ -90,15 +108,10 @@ class TestMST(unittest.TestCase):
         """
         Test whether tree check root connection of tree correctly when vertices are connected.
         """
-        vertices = ['A', 'B', 'E']
-        edges = [
-            [1, 'A', 'E'],
-            [3, 'A', 'B'],
-        ]
-        mst = MinimumSpanningTree(vertices, edges)
-        mst.build()
+        mst = self.connected_mst
+        vertices = mst.vertices
 
-        for pairs in list(itertools.combinations(vertices, 2)):
+        for pairs in itertools.combinations(vertices, 2):
             # All pairs should be connected
             vertex_1, vertex_2 = pairs
             is_connected = mst.check_connected(vertex_1, vertex_2)
@@ -108,35 +121,22 @@ class TestMST(unittest.TestCase):
         """
         Test whether tree check root connection of tree correctly vertices are not fully connected.
         """
-        vertices = ['A', 'E', 'C', 'D']
-        edges = [
-            [1, 'A', 'E'],
-            [2, 'C', 'D'],
-        ]
-        mst = MinimumSpanningTree(vertices, edges)
-        mst.build()
+        mst = self.disconnected_mst
+        vertices = mst.vertices
 
-        for pairs in list(itertools.combinations(vertices, 2)):
-            # All pairs should be connected except {'A', 'E'} and {'C', 'D'}
+        # Only {'A', 'E'} and {'C', 'D'} should be connected
+        connected_pairs = {frozenset({'A', 'E'}), frozenset({'C', 'D'})}
+
+        for pairs in itertools.combinations(vertices, 2):
             vertex_1, vertex_2 = pairs
-            pairs_set = set(pairs)
             is_connected = mst.check_connected(vertex_1, vertex_2)
-            if pairs_set in ({'A', 'E'}, {'C', 'D'}):
-                pass
-            else:
-                is_connected = not is_connected
-
-            self.assertTrue(is_connected)
+            self.assertEqual(frozenset(pairs) in connected_pairs, is_connected)
 
     def test_union_parent(self):
         """
         Test whether tree union parents of two vertices correctly
         """
-        vertices = ['A', 'B', 'E']
-        edges = [
-            [1, 'A', 'E'],
-            [3, 'A', 'B'],
-        ]
+        vertices, edges = self.connected_graph
         mst = MinimumSpanningTree(vertices, edges)
         mst.union_parent('A', 'B')
 
@@ -154,23 +154,34 @@ class TestMST(unittest.TestCase):
 
         self.assertEqual(num_vertices-1, num_edges)
 
+    def test_edges_of_tree(self):
+        """
+        Test the edges of MST all at once.
+        """
+        edges = {(distance, frozenset({vertex_1, vertex_2}))
+                 for distance, vertex_1, vertex_2 in self.mst.graph_edges}
+
+        self.assertSetEqual(self.tree_edges, edges)
+
     def test_path_of_vertices(self):
         """
         Test the path of vertices of MST
         """
         for pair, answer in self.paths.items():
-            answer_path, _ = answer
-            path, _ = self.mst.find_path(*pair)
-            self.assertListEqual(answer_path, path)
+            with self.subTest(pair=pair):
+                answer_path, _ = answer
+                path, _ = self.mst.find_path(*pair)
+                self.assertListEqual(answer_path, path)
 
     def test_distance_of_vertices(self):
         """
         Test the path of vertices of MST.
         """
         for pair, answer in self.paths.items():
-            _, answer_distance = answer
-            _, distance = self.mst.find_path(*pair)
-            self.assertEqual(answer_distance, distance)
+            with self.subTest(pair=pair):
+                _, answer_distance = answer
+                _, distance = self.mst.find_path(*pair)
+                self.assertAlmostEqual(answer_distance, distance)
 
 
 if __name__ == '__main__':
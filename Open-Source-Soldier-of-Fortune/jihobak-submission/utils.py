@@ -3,6 +3,7 @@ In this script, I write useful method for Skill Set Challenge Hudson & Thames
 """
 
 import numpy as np
+import pandas as pd
 
 
 def compute_log_returns(prices):
@@ -20,7 +21,9 @@ def compute_log_returns(prices):
         Log returns for each ticker and date
     """
 
-    log_returns = np.log(prices/prices.shift(1))[1:]
+    # difference of log prices, without building shifted/divided intermediate frames
+    log_returns = pd.DataFrame(np.diff(np.log(prices.to_numpy()), axis=0),
+                               index=prices.index[1:], columns=prices.columns)
 
     return log_returns
 
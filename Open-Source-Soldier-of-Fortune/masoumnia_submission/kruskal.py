@@ -56,10 +56,12 @@ def edges(matrix):
         matrix: Pandas DataFrame
             Adjacency matrix of graph structure to derive list of pairs from.
     """
-    raw_edges = matrix.unstack()  # series of raw edge pairs
-    edges_ord = raw_edges.sort_values(
-        kind="mergesort")  # edge pairs by distance
-    pairs = edges_ord[edges_ord != 0].index.tolist()  # remove non-edges
+    values = matrix.to_numpy()
+    # (column, row) positions of the edges, skipping the zero half of a
+    # triangular matrix before anything is sorted; column-major like unstack
+    cols, rows = np.nonzero(values.T)
+    order = np.argsort(values[rows, cols], kind="mergesort")  # edges by distance
+    pairs = list(zip(matrix.columns[cols[order]], matrix.index[rows[order]]))
     return pairs
 
 
@@ -1,6 +1,4 @@
 import numpy as np
-from scipy.sparse.csgraph import connected_components
-from scipy.sparse import csr_matrix
 
 def compute_adjacency_mst_and_distances(log_returns):
     """Computes the adjacency matrix of a minimum spannig tree
@@ -42,23 +40,26 @@ def compute_adjacency_mst_and_distances(log_returns):
     edge_pairs_sorted = edge_pairs[:,idx_sorted]
     # initialize adjacency matrix as a fully disconnected graph
     adjacency = np.zeros((n_nodes, n_nodes))
+    # component label of every node, each node starts in its own component;
+    # the labels are merged as edges are added instead of recomputing the
+    # connected components of the whole graph for every candidate edge
+    labels = np.arange(n_nodes)
+    n_edges = 0
     # loop over the N * (N - 1) edges
     for k in range(len(upper_vec_dist)):
         # get the pair with the k-th smallest distance
         i, j = edge_pairs_sorted[:, k]
-        # compute the connected components of the current graph
-        n_comp, labels = connected_components(csgraph=csr_matrix(adjacency),
-                                              directed=False, return_labels=True)
         # if node i and j do not belog to the same component
         # then it means they are disconnected, in which case
-        # we should connect them
+        # we should connect them and merge their components
         if not labels[i] == labels[j]:
             adjacency[i, j] = 1 # connect nodes i and j
+            labels[labels == labels[j]] = labels[i]
+            n_edges += 1
         # we can terminate the loop earlier if the graph is already a tree
         # note: a tree is a connected graph whose number of edges is exactly
         # n_nodes - 1
-        if (int(0.5*np.sum(adjacency > 0)) == (n_nodes - 1)
-            and n_comp == 1):
+        if n_edges == (n_nodes - 1):
             break
     # since we only looped over the pairs of the upper triangular part
     # we need to symmetrize the adjacency matrix